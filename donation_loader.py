@@ -0,0 +1,52 @@
+"""
+Single-pass loader for donation records
+
+Uses only the standard library so it can optionally be compiled ahead of time with mypyc.
+A compiled extension module takes precedence over this file when both are present.
+"""
+
+from array import array
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, Iterable, List, NamedTuple
+
+
+class LoadedDonations(NamedTuple):
+    cents: array
+    supporter_groups: array
+    day_groups: array
+    supporter_names: List[str]
+    days: List[str]
+
+
+def load_donations(donations: Iterable[Dict[str, Any]]) -> LoadedDonations:
+    """
+    Read donations once, converting amounts to integer cents and interning supporter IDs and dates
+    Group indices point into supporter_names / days; rows without a timestamp get day group -1
+    """
+    cents: array = array('q')
+    supporter_groups: array = array('q')
+    day_groups: array = array('q')
+    # Unseen keys are assigned the next free index on first lookup
+    supporter_index: DefaultDict[Any, int] = defaultdict()
+    supporter_index.default_factory = supporter_index.__len__
+    supporter_names: List[str] = []
+    day_index: DefaultDict[str, int] = defaultdict()
+    day_index.default_factory = day_index.__len__
+    
+    for donation in donations:
+        cents.append(round(float(donation.get('amount', 0)) * 100))
+        
+        supporter_id = donation.get('supporter_id')
+        group: int = supporter_index[supporter_id]
+        if group == len(supporter_names):
+            supporter_names.append(donation.get('supporter_name', f'Supporter {supporter_id}'))
+        supporter_groups.append(group)
+        
+        # Date part of an ISO-8601 timestamp; slicing avoids split() allocating a list per row
+        created_at = donation.get('created_at')
+        if created_at:
+            day_groups.append(day_index[created_at[:10]])
+        else:
+            day_groups.append(-1)
+    
+    return LoadedDonations(cents, supporter_groups, day_groups, supporter_names, list(day_index))
@@ -5,35 +5,186 @@ Monthly Donation Report Generator
 A Python automation tool that generates professional monthly PDF reports for tracking donations and supporter contributions.
 """
 
+import io
 import os
 import sys
 import json
+import hashlib
+import tempfile
+import heapq
 import argparse
-from datetime import datetime, timedelta
+import asyncio
+from datetime import date, datetime, timedelta
 import calendar
-from typing import Dict, List, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Tuple, Optional, Union
 
+import aiohttp
+import ijson
+import numpy as np
+import orjson
 import requests
+import matplotlib
+matplotlib.use('Agg')  # Render off-screen; no GUI backend is needed for saved charts
 import matplotlib.pyplot as plt
 from fpdf import FPDF
 
+from donation_loader import load_donations
+
+# Above this many days the daily revenue chart is bucketed by week
+MAX_DAILY_BARS = 62
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to NumPy
+    njit = None
+
+
+def _group_sum(group_ids: np.ndarray, amounts: np.ndarray, n_groups: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sum integer cent amounts and count rows per group in a single pass
+    """
+    totals = np.zeros(n_groups, dtype=np.int64)
+    counts = np.zeros(n_groups, dtype=np.int64)
+    for i in range(group_ids.size):
+        group = group_ids[i]
+        totals[group] += amounts[i]
+        counts[group] += 1
+    return totals, counts
+
+
+if njit is not None:
+    _group_sum = njit(cache=True)(_group_sum)
+    # Compile once at import so the first report doesn't pay for it
+    _group_sum(np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64), 1)
+else:
+    def _group_sum(group_ids: np.ndarray, amounts: np.ndarray, n_groups: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sum integer cent amounts and count rows per group (NumPy fallback)
+        """
+        # Float sums of whole cents are exact well beyond any realistic total
+        totals = np.bincount(group_ids, weights=amounts, minlength=n_groups).astype(np.int64)
+        counts = np.bincount(group_ids, minlength=n_groups)
+        return totals, counts
+
+
+class _TeeReader:
+    """
+    File-like wrapper that copies everything read from a stream into a sink
+    """
+    
+    def __init__(self, stream, sink):
+        self.stream = stream
+        self.sink = sink
+    
+    def read(self, size: int = -1) -> bytes:
+        data = self.stream.read(size)
+        self.sink.write(data)
+        return data
+
+
+class CacheLookup(NamedTuple):
+    """
+    Outcome of checking the response cache before a month's request
+    """
+    key: str
+    entry: Optional[Tuple[str, List[Dict], bool]]
+    immutable: bool
+    fresh: bool
+    headers: Dict[str, str]
+
 
 class DonationReportGenerator:
     """
     Main class for generating monthly donation reports
     """
     
-    def __init__(self, api_token: str, api_base_url: str = "https://api.donationplatform.com"):
+    def __init__(self, api_token: str, api_base_url: str = "https://api.donationplatform.com",
+                 cache_dir: Optional[str] = ".donation_cache"):
         self.api_token = api_token
         self.api_base_url = api_base_url
         self.headers = {
             'Authorization': f'Bearer {api_token}',
             'Content-Type': 'application/json'
         }
-        
-    def get_donations_for_month(self, year: int, month: int) -> List[Dict]:
+        # Persistent session so repeated calls reuse the same keep-alive connection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # Directory for ETag-validated response bodies (None disables caching)
+        self.cache_dir = cache_dir
+    
+    def _cache_key(self, url: str, start_date: str, end_date: str) -> str:
         """
-        Retrieve all donations for a specific month from the API
+        Build the cache key for a request, scoped to the API token
+        """
+        return hashlib.sha256(f"{url}|{start_date}|{end_date}|{self.api_token}".encode()).hexdigest()
+    
+    def _load_cached_response(self, key: str) -> Optional[Tuple[str, List[Dict], bool]]:
+        """
+        Return the stored (etag, donations, final) entry for a cache key, if any
+        A missing, unreadable or corrupt entry is treated as a cache miss
+        """
+        if not self.cache_dir:
+            return None
+        etag_path = os.path.join(self.cache_dir, f"{key}.etag")
+        body_path = os.path.join(self.cache_dir, f"{key}.json")
+        try:
+            with open(etag_path, 'r') as f:
+                etag = f.read()
+            with open(body_path, 'rb') as f:
+                donations = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        final = os.path.exists(os.path.join(self.cache_dir, f"{key}.final"))
+        return etag, donations, final
+    
+    def _write_cache_file(self, filename: str, data: bytes) -> None:
+        """
+        Atomically replace a file in the cache directory, so an interrupted run never leaves a partial file
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, os.path.join(self.cache_dir, filename))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    
+    def _finish_cached_response(self, key: str, etag: str, final: bool) -> None:
+        """
+        Record the ETag for a body that is already in place, and whether the body is final
+        Only data fetched or revalidated after its month ended is final; anything else is revalidated on use
+        """
+        self._write_cache_file(f"{key}.etag", etag.encode())
+        final_path = os.path.join(self.cache_dir, f"{key}.final")
+        if final:
+            self._write_cache_file(f"{key}.final", b'')
+        elif os.path.exists(final_path):
+            os.unlink(final_path)
+    
+    def _store_cached_response(self, key: str, etag: str, body: bytes, final: bool) -> None:
+        """
+        Store a response body alongside the ETag it was served with
+        """
+        if not self.cache_dir:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Body first: an etag on disk must never point at a body that isn't there yet
+        self._write_cache_file(f"{key}.json", body)
+        self._finish_cached_response(key, etag, final)
+    
+    @staticmethod
+    def _is_past_month(year: int, month: int) -> bool:
+        """
+        Whether the month has fully ended, so its donations can no longer change
+        """
+        last_day = calendar.monthrange(year, month)[1]
+        return date(year, month, last_day) < date.today()
+    
+    def _month_request(self, year: int, month: int) -> Tuple[str, Dict[str, str]]:
+        """
+        Build the donations endpoint URL and query parameters for a month
         """
         # Calculate start and end dates for the month
         start_date = datetime(year, month, 1).strftime('%Y-%m-%d')
@@ -49,17 +200,143 @@ class DonationReportGenerator:
             'start_date': start_date,
             'end_date': end_date
         }
+        return url, params
+    
+    def _lookup_cache(self, year: int, month: int, url: str, params: Dict[str, str]) -> CacheLookup:
+        """
+        Decide how a month's request should use the cache
+        Either the cached copy can be served as is, or it is revalidated with If-None-Match
+        """
+        key = self._cache_key(url, params['start_date'], params['end_date'])
+        entry = self._load_cached_response(key)
+        immutable = self._is_past_month(year, month)
+        # A final entry was stored after its month ended, so it is complete and used without
+        # contacting the API; entries saved while the month was in progress are revalidated
+        fresh = entry is not None and entry[2]
+        # Revalidate any cached copy so an unchanged month comes back as 304 with no body
+        headers = {'If-None-Match': entry[0]} if entry and entry[0] and not fresh else {}
+        return CacheLookup(key, entry, immutable, fresh, headers)
+    
+    def _should_store(self, lookup: CacheLookup, etag: Optional[str]) -> bool:
+        """
+        Whether a fresh response is worth caching: it can be revalidated or can no longer change
+        """
+        return bool(self.cache_dir) and bool(etag or lookup.immutable)
+    
+    def _store_response(self, lookup: CacheLookup, etag: Optional[str], body: bytes) -> List[Dict]:
+        """
+        Cache a fresh response body if worthwhile, and parse it
+        """
+        if self._should_store(lookup, etag):
+            self._store_cached_response(lookup.key, etag or '', body, lookup.immutable)
+        return orjson.loads(body)
+    
+    def _revalidated(self, lookup: CacheLookup) -> List[Dict]:
+        """
+        Serve the cached copy after a 304; once the month has ended this makes the entry final
+        """
+        if lookup.immutable and not lookup.entry[2]:
+            self._finish_cached_response(lookup.key, lookup.entry[0], True)
+        return lookup.entry[1]
+    
+    def get_donations_for_month(self, year: int, month: int) -> List[Dict]:
+        """
+        Retrieve all donations for a specific month from the API
+        """
+        url, params = self._month_request(year, month)
+        
+        lookup = self._lookup_cache(year, month, url, params)
+        if lookup.fresh:
+            return lookup.entry[1]
         
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.session.get(url, params=params, headers=lookup.headers)
+        if response.status_code == 304 and lookup.entry:
+            return self._revalidated(lookup)
         response.raise_for_status()
         
-        return response.json()
+        return self._store_response(lookup, response.headers.get('ETag'), response.content)
+    
+    async def _fetch(self, session: aiohttp.ClientSession, year: int, month: int) -> List[Dict]:
+        """
+        Retrieve the donations for one month over a shared aiohttp session
+        """
+        url, params = self._month_request(year, month)
+        
+        # Cache files are read and written in a worker thread so they don't block the event loop
+        lookup = await asyncio.to_thread(self._lookup_cache, year, month, url, params)
+        if lookup.fresh:
+            return lookup.entry[1]
+        
+        async with session.get(url, params=params, headers=lookup.headers) as response:
+            if response.status == 304 and lookup.entry:
+                return await asyncio.to_thread(self._revalidated, lookup)
+            response.raise_for_status()
+            body = await response.read()
+            etag = response.headers.get('ETag')
+        
+        return await asyncio.to_thread(self._store_response, lookup, etag, body)
+    
+    async def _fetch_months(self, year_months: List[Tuple[int, int]]) -> List[List[Dict]]:
+        """
+        Issue the requests for all months concurrently
+        """
+        connector = aiohttp.TCPConnector(limit=8)
+        async with aiohttp.ClientSession(headers=self.headers, connector=connector) as session:
+            return await asyncio.gather(*(self._fetch(session, year, month) for year, month in year_months))
+    
+    def get_donations_for_months(self, year_months: List[Tuple[int, int]]) -> List[List[Dict]]:
+        """
+        Retrieve donations for several (year, month) pairs concurrently
+        Returns one list of donations per pair, in the order given
+        """
+        return asyncio.run(self._fetch_months(year_months))
+    
+    def iter_donations_for_month(self, year: int, month: int) -> Iterator[Dict]:
+        """
+        Stream the donations for a specific month from the API one at a time
+        The response is parsed incrementally, so the full payload is never held in memory
+        """
+        url, params = self._month_request(year, month)
+        
+        lookup = self._lookup_cache(year, month, url, params)
+        if lookup.fresh:
+            yield from lookup.entry[1]
+            return
+        
+        with self.session.get(url, params=params, headers=lookup.headers, stream=True) as response:
+            if response.status_code == 304 and lookup.entry:
+                yield from self._revalidated(lookup)
+                return
+            response.raise_for_status()
+            response.raw.decode_content = True
+            etag = response.headers.get('ETag')
+            
+            if not self._should_store(lookup, etag):
+                yield from ijson.items(response.raw, 'item', use_float=True)
+                return
+            
+            # Copy the bytes to a temp file as they are parsed; it only replaces the cached
+            # body once the whole response has been read
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as sink:
+                    yield from ijson.items(_TeeReader(response.raw, sink), 'item', use_float=True)
+                os.replace(tmp_path, os.path.join(self.cache_dir, f"{lookup.key}.json"))
+            finally:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+            self._finish_cached_response(lookup.key, etag or '', lookup.immutable)
     
-    def analyze_donations(self, donations: List[Dict]) -> Dict:
+    def analyze_donations(self, donations: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Analyze donation data to extract key statistics
+        Accepts a list or any iterable of donations, e.g. from iter_donations_for_month
         """
-        if not donations:
+        # Load amounts (as integer cents) and intern supporter IDs and dates as group indices in a single pass
+        loaded = load_donations(donations)
+        
+        if not loaded.cents:
             return {
                 'total_supporters': 0,
                 'unique_supporters': 0,
@@ -70,67 +347,40 @@ class DonationReportGenerator:
                 'daily_revenue': {}
             }
         
-        # Extract supporter IDs and donation amounts
-        supporter_ids = []
-        donation_amounts = []
-        daily_revenue = {}
-        
-        for donation in donations:
-            supporter_id = donation.get('supporter_id')
-            amount = float(donation.get('amount', 0))
-            created_at = donation.get('created_at', '')
-            
-            supporter_ids.append(supporter_id)
-            donation_amounts.append(amount)
-            
-            # Group by date for daily revenue
-            if created_at:
-                date_str = created_at.split('T')[0]  # Extract date part from ISO format
-                if date_str in daily_revenue:
-                    daily_revenue[date_str] += amount
-                else:
-                    daily_revenue[date_str] = amount
+        cents = np.frombuffer(loaded.cents, dtype=np.int64)
+        supporter_groups = np.frombuffer(loaded.supporter_groups, dtype=np.int64)
+        day_groups = np.frombuffer(loaded.day_groups, dtype=np.int64)
+        supporter_names = loaded.supporter_names
         
         # Calculate statistics
-        total_supporters = len(supporter_ids)
-        unique_supporters = len(set(supporter_ids)) if supporter_ids else 0
-        total_donations = len(donations)
-        total_revenue = sum(donation_amounts)
-        average_donation = total_revenue / total_donations if total_donations > 0 else 0.0
-        
-        # Get top supporters
-        supporter_totals = {}
-        for donation in donations:
-            supporter_id = donation.get('supporter_id')
-            supporter_name = donation.get('supporter_name', f'Supporter {supporter_id}')
-            amount = float(donation.get('amount', 0))
-            
-            if supporter_id in supporter_totals:
-                supporter_totals[supporter_id]['total'] += amount
-                supporter_totals[supporter_id]['count'] += 1
-            else:
-                supporter_totals[supporter_id] = {
-                    'name': supporter_name,
-                    'total': amount,
-                    'count': 1
-                }
-        
-        # Sort supporters by total donation amount
-        sorted_supporters = sorted(
-            supporter_totals.items(),
-            key=lambda x: x[1]['total'],
-            reverse=True
-        )
+        total_supporters = len(supporter_groups)
+        total_donations = len(cents)
+        total_cents = int(cents.sum())
+        total_revenue = total_cents / 100
+        average_donation = total_cents / total_donations / 100
+        
+        # Per-supporter totals and counts
+        totals, counts = _group_sum(supporter_groups, cents, len(supporter_names))
+        unique_supporters = len(supporter_names)
+        
+        # Get top supporters (ties keep the order supporters were first seen in)
+        supporter_totals = totals.tolist()
+        top_idx = heapq.nlargest(10, range(len(supporter_totals)), key=supporter_totals.__getitem__)
         
         top_supporters = [
             {
-                'name': supporter_data['name'],
-                'total_donated': supporter_data['total'],
-                'donation_count': supporter_data['count']
+                'name': supporter_names[i],
+                'total_donated': supporter_totals[i] / 100,
+                'donation_count': int(counts[i])
             }
-            for _, supporter_data in sorted_supporters[:10]
+            for i in top_idx
         ]
         
+        # Daily revenue
+        has_date = day_groups >= 0
+        day_totals, _ = _group_sum(day_groups[has_date], cents[has_date], len(loaded.days))
+        daily_revenue = {day: total / 100 for day, total in zip(loaded.days, day_totals.tolist())}
+        
         return {
             'total_supporters': total_supporters,
             'unique_supporters': unique_supporters,
@@ -141,37 +391,80 @@ class DonationReportGenerator:
             'daily_revenue': daily_revenue
         }
     
-    def create_visualizations(self, analysis_data: Dict, year: int, month: int) -> Tuple[str, str]:
+    def _render_chart(self, fig, path: str, persist: bool) -> io.BytesIO:
         """
-        Create visualization charts and save them as images
-        Returns paths to the saved images
+        Render a figure to an in-memory PNG, optionally also writing it to disk
+        """
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png', dpi=100, bbox_inches=None)
+        if persist:
+            with open(path, 'wb') as f:
+                f.write(buf.getvalue())
+        buf.seek(0)
+        return buf
+    
+    def create_visualizations(self, analysis_data: Dict, year: int, month: int,
+                              persist: bool = False) -> Tuple[io.BytesIO, io.BytesIO]:
+        """
+        Create visualization charts as in-memory PNG images
+        Returns buffers ready to embed in the PDF; with persist=True the images are also saved to report_images/
         """
         # Create directory for images if it doesn't exist
         img_dir = "report_images"
-        os.makedirs(img_dir, exist_ok=True)
+        if persist:
+            os.makedirs(img_dir, exist_ok=True)
+        
+        # One figure is reused for both charts; axes are cleared in between
+        fig, ax = plt.subplots(figsize=(12, 6))
         
         # Daily Revenue Chart
         daily_revenue_path = os.path.join(img_dir, f"daily_revenue_{year}_{month}.png")
-        if analysis_data['daily_revenue']:
-            dates = list(analysis_data['daily_revenue'].keys())
-            revenues = list(analysis_data['daily_revenue'].values())
+        # Keys come straight from created_at[:10]; skip any that are not ISO dates rather than fail the report
+        day_keys: List[np.datetime64] = []
+        day_revenues: List[float] = []
+        for day, revenue in analysis_data['daily_revenue'].items():
+            try:
+                day_keys.append(np.datetime64(day, 'D'))
+            except ValueError:
+                print(f"Warning: skipping donations with unparseable date {day!r}")
+                continue
+            day_revenues.append(revenue)
+        
+        if day_keys:
+            # Sort once as datetime64 so matplotlib places bars on a real date axis
+            dates = np.array(day_keys, dtype='datetime64[D]')
+            revenues = np.array(day_revenues, dtype=np.float64)
+            order = np.argsort(dates)
+            dates, revenues = dates[order], revenues[order]
+            chart_title = 'Daily Revenue'
+            xlabel = 'Date'
+            bar_width = 0.8
             
-            plt.figure(figsize=(12, 6))
-            plt.bar(dates, revenues)
-            plt.title(f'Daily Revenue - {calendar.month_name[month]} {year}')
-            plt.xlabel('Date')
-            plt.ylabel('Revenue ($)')
-            plt.xticks(rotation=45)
-            plt.tight_layout()
-            plt.savefig(daily_revenue_path)
-            plt.close()
+            if len(dates) > MAX_DAILY_BARS:
+                # Too many bars to draw one per day; bucket into ISO weeks (starting Monday)
+                week_starts = dates - (dates.astype(np.int64) - 4) % 7  # 1970-01-05 was a Monday
+                boundaries = np.flatnonzero(np.r_[True, week_starts[1:] != week_starts[:-1]])
+                revenues = np.add.reduceat(revenues, boundaries)
+                dates = week_starts[boundaries] + np.timedelta64(3, 'D')  # centre bars on the week
+                chart_title = 'Weekly Revenue'
+                xlabel = 'Week'
+                bar_width = 7 * 0.8
+            
+            ax.bar(dates, revenues, width=bar_width)
+            ax.set_title(f'{chart_title} - {calendar.month_name[month]} {year}')
+            ax.set_xlabel(xlabel)
+            ax.set_ylabel('Revenue ($)')
+            ax.tick_params(axis='x', labelrotation=45)
+            fig.tight_layout()
         else:
             # Create an empty chart image
-            plt.figure(figsize=(12, 6))
-            plt.text(0.5, 0.5, 'No data available', horizontalalignment='center', verticalalignment='center')
-            plt.title(f'Daily Revenue - {calendar.month_name[month]} {year}')
-            plt.savefig(daily_revenue_path)
-            plt.close()
+            ax.text(0.5, 0.5, 'No data available', horizontalalignment='center', verticalalignment='center')
+            ax.set_title(f'Daily Revenue - {calendar.month_name[month]} {year}')
+        daily_revenue_img = self._render_chart(fig, daily_revenue_path, persist)
+        
+        ax.clear()
+        ax.tick_params(axis='x', labelrotation=0)  # tick settings survive clear()
+        fig.set_size_inches(12, 8)
         
         # Top Supporters Chart
         top_supporters_path = os.path.join(img_dir, f"top_supporters_{year}_{month}.png")
@@ -179,33 +472,31 @@ class DonationReportGenerator:
             names = [s['name'] for s in analysis_data['top_supporters']]
             totals = [s['total_donated'] for s in analysis_data['top_supporters']]
             
-            plt.figure(figsize=(12, 8))
-            bars = plt.barh(names, totals)
-            plt.title(f'Top 10 Supporters - {calendar.month_name[month]} {year}')
-            plt.xlabel('Total Donated ($)')
-            plt.gca().invert_yaxis()  # Show highest donors at top
+            bars = ax.barh(names, totals)
+            ax.set_title(f'Top 10 Supporters - {calendar.month_name[month]} {year}')
+            ax.set_xlabel('Total Donated ($)')
+            ax.invert_yaxis()  # Show highest donors at top
             
             # Add value labels on bars
             for bar, total in zip(bars, totals):
                 width = bar.get_width()
-                plt.text(width, bar.get_y() + bar.get_height()/2, f'${total:.2f}', 
+                ax.text(width, bar.get_y() + bar.get_height()/2, f'${total:.2f}', 
                         ha='left', va='center')
             
-            plt.tight_layout()
-            plt.savefig(top_supporters_path)
-            plt.close()
+            fig.tight_layout()
         else:
             # Create an empty chart image
-            plt.figure(figsize=(12, 8))
-            plt.text(0.5, 0.5, 'No data available', horizontalalignment='center', verticalalignment='center')
-            plt.title(f'Top 10 Supporters - {calendar.month_name[month]} {year}')
-            plt.savefig(top_supporters_path)
-            plt.close()
+            ax.text(0.5, 0.5, 'No data available', horizontalalignment='center', verticalalignment='center')
+            ax.set_title(f'Top 10 Supporters - {calendar.month_name[month]} {year}')
+        top_supporters_img = self._render_chart(fig, top_supporters_path, persist)
         
-        return daily_revenue_path, top_supporters_path
+        plt.close(fig)
+        
+        return daily_revenue_img, top_supporters_img
     
     def generate_pdf_report(self, analysis_data: Dict, year: int, month: int, 
-                           daily_revenue_img: str, top_supporters_img: str) -> str:
+                           daily_revenue_img: Union[str, io.BytesIO],
+                           top_supporters_img: Union[str, io.BytesIO]) -> str:
         """
         Generate the final PDF report
         """
@@ -246,18 +537,15 @@ class DonationReportGenerator:
         pdf.add_page()
         pdf.set_font('Arial', 'B', 12)
         pdf.cell(0, 10, 'Top 10 Supporters', 0, 1)
-        pdf.set_font('Arial', 'B', 10)
-        pdf.cell(60, 10, 'Supporter Name', 1)
-        pdf.cell(50, 10, 'Total Donated', 1)
-        pdf.cell(40, 10, 'Donation Count', 1)
-        pdf.ln()
-        
         pdf.set_font('Arial', '', 10)
-        for supporter in analysis_data['top_supporters']:
-            pdf.cell(60, 8, supporter['name'], 1)
-            pdf.cell(50, 8, f'${supporter["total_donated"]:,.2f}', 1)
-            pdf.cell(40, 8, str(supporter['donation_count']), 1)
-            pdf.ln()
+        with pdf.table(width=150, col_widths=(60, 50, 40), align='LEFT', line_height=8) as table:
+            table.row(['Supporter Name', 'Total Donated', 'Donation Count'])
+            for supporter in analysis_data['top_supporters']:
+                table.row([
+                    supporter['name'],
+                    f'${supporter["total_donated"]:,.2f}',
+                    str(supporter['donation_count'])
+                ])
         
         # Top Supporters Chart
         pdf.ln(5)
@@ -269,6 +557,47 @@ class DonationReportGenerator:
         filename = f"donation_report_{year}_{month:02d}.pdf"
         pdf.output(filename)
         return filename
+    
+    def generate_monthly_report(self, year: int, month: int) -> str:
+        """
+        Run the full pipeline (fetch, analyze, chart, PDF) for one month
+        Returns the path of the generated PDF
+        """
+        # Stream the month's donations straight into the analysis
+        analysis = self.analyze_donations(self.iter_donations_for_month(year, month))
+        print(f"Retrieved {analysis['total_donations']} donations")
+        print("Analysis complete")
+        
+        # Create visualizations
+        daily_revenue_img, top_supporters_img = self.create_visualizations(analysis, year, month)
+        print("Visualizations created")
+        
+        # Generate PDF report
+        return self.generate_pdf_report(analysis, year, month, daily_revenue_img, top_supporters_img)
+    
+    @classmethod
+    def generate_many(cls, api_token: str, year_months: List[Tuple[int, int]],
+                      api_base_url: str = "https://api.donationplatform.com",
+                      cache_dir: Optional[str] = ".donation_cache",
+                      max_workers: Optional[int] = None) -> List[str]:
+        """
+        Generate reports for several (year, month) pairs in parallel worker processes
+        Returns the PDF paths in the order given
+        Call it under an `if __name__ == "__main__":` guard: spawn-based platforms (macOS, Windows)
+        re-import the main module in each worker
+        """
+        jobs = [(cls, api_token, api_base_url, cache_dir, year, month) for year, month in year_months]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_one_month, jobs))
+
+
+def _one_month(job: Tuple) -> str:
+    """
+    Generate a single month's report in a worker process (top-level so it can be pickled)
+    """
+    generator_cls, api_token, api_base_url, cache_dir, year, month = job
+    generator = generator_cls(api_token, api_base_url, cache_dir)
+    return generator.generate_monthly_report(year, month)
 
 
 def main():
@@ -298,21 +627,7 @@ def main():
     generator = DonationReportGenerator(args.token, args.api_url)
     
     try:
-        # Get donations for the month
-        donations = generator.get_donations_for_month(args.year, args.month)
-        print(f"Retrieved {len(donations)} donations")
-        
-        # Analyze the data
-        analysis = generator.analyze_donations(donations)
-        print("Analysis complete")
-        
-        # Create visualizations
-        daily_revenue_img, top_supporters_img = generator.create_visualizations(analysis, args.year, args.month)
-        print(f"Visualizations created: {daily_revenue_img}, {top_supporters_img}")
-        
-        # Generate PDF report
-        pdf_filename = generator.generate_pdf_report(analysis, args.year, args.month, 
-                                                     daily_revenue_img, top_supporters_img)
+        pdf_filename = generator.generate_monthly_report(args.year, args.month)
         print(f"Report generated successfully: {pdf_filename}")
         
     except requests.exceptions.RequestException as e:
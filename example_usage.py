@@ -36,7 +36,7 @@ def main():
         
         # Create visualizations
         daily_revenue_img, top_supporters_img = generator.create_visualizations(analysis, year, month)
-        print(f"Visualizations created: {daily_revenue_img}, {top_supporters_img}")
+        print("Visualizations created")
         
         # Generate PDF report
         pdf_filename = generator.generate_pdf_report(analysis, year, month, 
@@ -0,0 +1,105 @@
+"""
+Tests for the on-disk response cache of DonationReportGenerator
+"""
+
+import tempfile
+import unittest
+from datetime import date
+from unittest import mock
+
+import orjson
+
+import donation_report_generator
+from donation_report_generator import DonationReportGenerator
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, body: bytes = b'', etag: str = None):
+        self.status_code = status_code
+        self.content = body
+        self.headers = {'ETag': etag} if etag else {}
+    
+    def raise_for_status(self):
+        pass
+
+
+class FakeServer:
+    """
+    Stands in for requests.Session, answering with the current data and honouring If-None-Match
+    """
+    
+    def __init__(self):
+        self.donations = []
+        self.etag = None
+        self.requests = []
+    
+    def publish(self, donations, etag):
+        self.donations = donations
+        self.etag = etag
+    
+    def get(self, url, params=None, headers=None):
+        self.requests.append(dict(headers or {}))
+        if headers and headers.get('If-None-Match') == self.etag:
+            return FakeResponse(304)
+        return FakeResponse(200, orjson.dumps(self.donations), self.etag)
+
+
+def frozen_today(today: date):
+    """
+    Patch the generator's notion of today
+    """
+    class FrozenDate(date):
+        @classmethod
+        def today(cls):
+            return today
+    return mock.patch.object(donation_report_generator, 'date', FrozenDate)
+
+
+class ResponseCacheTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.server = FakeServer()
+        self.generator = DonationReportGenerator('token', cache_dir=tempfile.mkdtemp())
+        self.generator.session = self.server
+    
+    def fetch(self, year, month):
+        with mock.patch('builtins.print'):
+            return self.generator.get_donations_for_month(year, month)
+    
+    def test_month_cached_while_in_progress_is_revalidated_after_it_ends(self):
+        self.server.publish([{'amount': 1}], '"v1"')
+        with frozen_today(date(2026, 9, 15)):
+            self.assertEqual(self.fetch(2026, 9), [{'amount': 1}])
+        
+        self.server.publish([{'amount': 1}, {'amount': 2}], '"v2"')
+        with frozen_today(date(2026, 10, 15)):
+            self.assertEqual(self.fetch(2026, 9), [{'amount': 1}, {'amount': 2}])
+            self.assertEqual(self.server.requests[-1], {'If-None-Match': '"v1"'})
+            
+            # Fetched after the month ended, so now final and served without a request
+            self.assertEqual(self.fetch(2026, 9), [{'amount': 1}, {'amount': 2}])
+        self.assertEqual(len(self.server.requests), 2)
+    
+    def test_not_modified_after_month_end_makes_entry_final(self):
+        self.server.publish([{'amount': 1}], '"v1"')
+        with frozen_today(date(2026, 9, 15)):
+            self.fetch(2026, 9)
+        with frozen_today(date(2026, 10, 15)):
+            self.assertEqual(self.fetch(2026, 9), [{'amount': 1}])
+            self.assertEqual(self.fetch(2026, 9), [{'amount': 1}])
+        self.assertEqual(len(self.server.requests), 2)
+    
+    def test_corrupt_body_is_refetched(self):
+        self.server.publish([{'amount': 1}], '"v1"')
+        with frozen_today(date(2026, 10, 15)):
+            self.fetch(2026, 9)
+            url = f"{self.generator.api_base_url}/donations"
+            key = self.generator._cache_key(url, '2026-09-01', '2026-09-30')
+            with open(f"{self.generator.cache_dir}/{key}.json", 'wb') as f:
+                f.write(b'[{"amo')
+            self.assertEqual(self.fetch(2026, 9), [{'amount': 1}])
+        self.assertEqual(len(self.server.requests), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()